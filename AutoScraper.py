@@ -1,29 +1,16 @@
 import os
 import os.path
 import base64
+import json
 import re
 import uuid
 import time
+import hashlib
 from datetime import datetime
 
-# Google API Imports
-from google.auth.transport.requests import Request
-from google.oauth2.credentials import Credentials
-from google_auth_oauthlib.flow import InstalledAppFlow
-from googleapiclient.discovery import build
-from googleapiclient.errors import HttpError
-from bs4 import BeautifulSoup
-
-# Selenium Imports
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import StaleElementReferenceException
-
-# SQL Server Import
-import pyodbc
+# Heavy third-party modules (Google API client, BeautifulSoup, Selenium, pyodbc) are
+# imported inside the functions that use them, so runs that exit early after the
+# Gmail check never pay for loading the browser, HTML parser or database stacks.
 
 #     CONFIGURATION    
 # Defines the Google API access scopes required for Gmail and Google Sheets
@@ -50,10 +37,14 @@ SQL_TRUSTED_CONNECTION = True
 # Local Download Configuration
 BASE_DOWNLOAD_DIR = os.path.join(os.getcwd(), 'downloads')
 
+# Local cache for Google API discovery documents
+DISCOVERY_CACHE_DIR = os.path.join(os.getcwd(), '.discovery_cache')
+
 #     DATABASE FUNCTIONS    
 
 def get_db_connection():
     # Establishes and returns a connection to the SQL Server database.
+    import pyodbc
     try:
         if SQL_TRUSTED_CONNECTION:
             conn_str = (
@@ -83,6 +74,7 @@ def get_db_connection():
 def check_track_exists_in_db(connection, title, artist):
     # Queries the database to check if a specific track by an artist is already logged.
     if not connection: return 'Error'
+    import pyodbc
     try:
         cursor = connection.cursor()
         query = "SELECT COUNT(*) FROM Tracks WHERE LOWER(TrackTitle) = LOWER(?) AND LOWER(Artist) = LOWER(?)"
@@ -104,8 +96,36 @@ def close_db_connection(connection):
 
 #     AUTHENTICATION FUNCTIONS    
 
-def authenticate():
-    # Handles Google OAuth2 authentication flow and returns initialized Gmail and Sheets service objects.
+class DiscoveryFileCache:
+    # Stores googleapiclient discovery documents on disk so build() does not re-fetch them every run.
+    def __init__(self, cache_dir=DISCOVERY_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def _path(self, url):
+        return os.path.join(self.cache_dir, hashlib.sha1(url.encode('utf-8')).hexdigest() + '.json')
+
+    def get(self, url):
+        try:
+            with open(self._path(url), 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError: return None
+
+    def set(self, url, content):
+        try:
+            if not os.path.exists(self.cache_dir):
+                os.makedirs(self.cache_dir)
+            if isinstance(content, bytes):
+                content = content.decode('utf-8')
+            json.loads(content)  # Only cache documents that parse cleanly.
+            with open(self._path(url), 'w', encoding='utf-8') as f:
+                f.write(content)
+        except (OSError, ValueError): pass
+
+def get_credentials():
+    # Handles Google OAuth2 authentication flow and returns valid credentials.
+    from google.auth.transport.requests import Request
+    from google.oauth2.credentials import Credentials
+    from google_auth_oauthlib.flow import InstalledAppFlow
     creds = None
     if os.path.exists('token.json'):
         creds = Credentials.from_authorized_user_file('token.json', SCOPES)
@@ -117,12 +137,18 @@ def authenticate():
             creds = flow.run_local_server(port=0)
         with open('token.json', 'w') as token:
             token.write(creds.to_json())
-    return build('gmail', 'v1', credentials=creds), build('sheets', 'v4', credentials=creds)
+    return creds
+
+def build_service(name, version, creds):
+    # Builds a Google API service object, reusing locally cached discovery documents.
+    from googleapiclient.discovery import build
+    return build(name, version, credentials=creds, cache=DiscoveryFileCache())
 
 #     GMAIL FUNCTIONS    
 
 def get_unread_emails_from_sender(gmail_service, sender_email):
     # Fetches all unread emails from a specific sender using the Gmail API.
+    from googleapiclient.errors import HttpError
     try:
         query = f'from:{sender_email} is:unread'
         results = gmail_service.users().messages().list(userId='me', q=query).execute()
@@ -136,6 +162,7 @@ def get_unread_emails_from_sender(gmail_service, sender_email):
 
 def mark_email_as_read(gmail_service, msg_id):
     # Removes the 'UNREAD' label from a specific email to prevent processing it again.
+    from googleapiclient.errors import HttpError
     try:
         gmail_service.users().messages().modify(userId='me', id=msg_id, body={'removeLabelIds': ['UNREAD']}).execute()
         print(f'Marked email {msg_id[:8]}... as read')
@@ -144,6 +171,7 @@ def mark_email_as_read(gmail_service, msg_id):
 
 def get_email_body(gmail_service, msg_id):
     # Decodes and extracts the raw HTML body content from a specific email message.
+    from googleapiclient.errors import HttpError
     try:
         message = gmail_service.users().messages().get(userId='me', id=msg_id, format='full').execute()
         payload = message['payload']
@@ -166,6 +194,7 @@ def get_email_body(gmail_service, msg_id):
 
 def extract_press_play_url(html_content):
     # Parses the email HTML to find and extract the destination URL hidden behind a 'Get Now' button/link.
+    from bs4 import BeautifulSoup
     try:
         soup = BeautifulSoup(html_content, 'html.parser')
         press_play_link = soup.find('a', string=re.compile(r'Get Now', re.IGNORECASE))
@@ -180,6 +209,8 @@ def extract_press_play_url(html_content):
 
 def setup_selenium_driver(download_folder=None):
     # Configures and launches a headless compatible Chrome WebDriver with automatic download preferences.
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
     chrome_options = Options()
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
@@ -243,6 +274,7 @@ def wait_for_downloads_to_finish(download_folder, timeout=300):
 
 def scrape_and_check_tracks(press_play_url, db_connection):
     # Navigates to the extracted URL, logs in if required, and scrapes the track names and artists from the DOM.
+    from selenium.webdriver.common.by import By
     driver = None
     tracks_data = []
     try:
@@ -330,6 +362,9 @@ def scrape_and_check_tracks(press_play_url, db_connection):
 
 def trigger_download_wav(driver, row_element):
     # Finds the track context menu and triggers the 'Download WAV' option specifically.
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
     wait = WebDriverWait(driver, 10)
     try:
         potential_buttons = row_element.find_elements(By.CSS_SELECTOR, "button, svg, [role='button'], .cursor-pointer, i")
@@ -359,6 +394,8 @@ def trigger_download_wav(driver, row_element):
 
 def download_tracks_from_sheet(sheets_service, press_play_url, unique_id):
     # Reads the Google Sheet to see which scraped tracks aren't in the DB, then orchestrates downloading them.
+    from selenium.webdriver.common.by import By
+    from selenium.common.exceptions import StaleElementReferenceException
     driver = None
     downloaded_count = 0
     download_path = os.path.join(BASE_DOWNLOAD_DIR, unique_id)
@@ -458,6 +495,7 @@ def download_tracks_from_sheet(sheets_service, press_play_url, unique_id):
 
 def ensure_signature_sheet_exists(sheets_service):
     # Verifies the logging tab exists in Google Sheets, creating it with headers if missing.
+    from googleapiclient.errors import HttpError
     try:
         sheets_service.spreadsheets().values().get(spreadsheetId=SPREADSHEET_ID, range=f'{SIGNATURE_SHEET}!A1').execute()
     except HttpError:
@@ -600,7 +638,18 @@ def main():
     print('Email to Music Downloader - V3.0')
     print('=' * 70)
     
-    gmail, sheets = authenticate()
+    start_time = time.perf_counter()
+    
+    creds = get_credentials()
+    gmail = build_service('gmail', 'v1', creds)
+    messages = get_unread_emails_from_sender(gmail, SENDER_EMAIL)
+    
+    # Fast exit: nothing to process, so skip Sheets, SQL Server and Selenium entirely.
+    if not messages:
+        print(f'No unread emails from {SENDER_EMAIL}. Nothing to do ({time.perf_counter() - start_time:.2f}s).')
+        return
+    
+    sheets = build_service('sheets', 'v4', creds)
     db_conn = get_db_connection()
     if not db_conn: return
     
@@ -608,7 +657,6 @@ def main():
     ensure_main_sheet_has_headers(sheets)
     
     current_run = get_last_run_number(sheets) + 1
-    messages = get_unread_emails_from_sender(gmail, SENDER_EMAIL)
     existing_urls = get_existing_urls(sheets)
     next_row = get_next_row_number(sheets)
     stats = {'processed': 0, 'tracks': 0, 'downloaded': 0}